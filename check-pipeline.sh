@@ -82,7 +82,7 @@ print_status "Running Tests"
 echo "=========================================="
 
 # Unit tests
-run_check "Unit tests" "uv run python -m pytest tests/ -v"
+run_check "Unit tests" "uv run python -m pytest tests/ -v -n auto --dist=loadscope"
 
 echo "=========================================="
 print_status "Running Script Validation"
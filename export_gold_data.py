@@ -14,7 +14,7 @@ from pathlib import Path
 from modules.exporters.glossary_exporter import GlossaryExporter
 from modules.exporters.rule_exporter import RuleExporter
 from modules.exporters.synthetic_exporter import SyntheticExporter
-from modules.exporters.utils import load_json
+from modules.exporters.utils import list_files, load_json
 from modules.logger import logger
 from modules.schemas import GoldTrainingSample
 
@@ -294,7 +294,7 @@ def validate_samples(gold_dir: Path) -> int:
         if not split_dir.exists():
             continue
 
-        for jsonl_file in split_dir.glob("*.jsonl"):
+        for jsonl_file in list_files(split_dir, ".jsonl"):
             logger.info(f"\nValidating: {jsonl_file.name}")
 
             try:
@@ -331,7 +331,7 @@ def run_eval(args: argparse.Namespace) -> int:
     logger.info("GOLD LAYER EVALUATION")
     logger.info("=" * 80)
 
-    eval_files = list(args.eval_dir.glob("*_eval.jsonl"))
+    eval_files = list_files(args.eval_dir, "_eval.jsonl")
     if not eval_files:
         logger.error(f"No eval files found in {args.eval_dir}")
         return 1
@@ -72,7 +72,7 @@ def extract_section_html(html_content: str, section_id: str) -> str:
     if not html_content:
         return ""
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, "lxml")
 
     section_element = None
 
@@ -190,7 +190,7 @@ def extract_legal_metadata(
     Returns:
         Dictionary with extracted legal metadata
     """
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, "lxml")
 
     legal_metadata: dict[str, Any] = {}
 
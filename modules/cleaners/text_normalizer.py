@@ -12,6 +12,28 @@ from bs4 import BeautifulSoup
 DEFAULT_MIN_TEXT_LENGTH = 50
 TEXT_PREVIEW_BREAK_RATIO = 0.7
 
+_WS_RE = re.compile(r"\s+")
+
+# Legal metadata lookups, built once and reused for every section
+_TITLE_SELECTORS = (
+    "h1.title",
+    "h1",
+    ".document-title",
+    ".law-title",
+    "title",
+    ".main-title",
+    ".page-title",
+)
+_REPEALED_INDICATORS = ("opphevet", "repealed", "ikrafttredelse", "endret")
+_AMENDMENT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"endret ved (?:lov|forskrift)[^0-9]*(\d{1,2}\s+\w+\s+\d{4})",
+        r"ikrafttredelse[^0-9]*(\d{1,2}\s+\w+\s+\d{4})",
+        r"(\d{1,2}\s+\w+\s+\d{4})[^0-9]*(?:endret|ikrafttredelse)",
+    )
+)
+
 
 def normalize_text(text: str) -> str:
     """
@@ -26,16 +48,13 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
+    # html.parser keeps stray '<' in plain text, which lxml would drop
     soup = BeautifulSoup(text, "html.parser")
 
     for script in soup(["script", "style"]):
         script.decompose()
 
-    text_content = soup.get_text()
-    text_content = re.sub(r"\s+", " ", text_content)
-    text_content = text_content.strip()
-
-    return text_content
+    return _WS_RE.sub(" ", soup.get_text()).strip()
 
 
 def compute_stable_hash(text: str) -> str:
@@ -51,8 +70,7 @@ def compute_stable_hash(text: str) -> str:
     if not text:
         return ""
 
-    canonical = text.lower().strip()
-    canonical = re.sub(r"\s+", " ", canonical)
+    canonical = _WS_RE.sub(" ", text.lower().strip())
     canonical = canonical.encode("utf-8").decode("unicode_escape")
 
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -75,17 +93,7 @@ def extract_legal_metadata(
 
     legal_metadata: dict[str, Any] = {}
 
-    title_selectors = [
-        "h1.title",
-        "h1",
-        ".document-title",
-        ".law-title",
-        "title",
-        ".main-title",
-        ".page-title",
-    ]
-
-    for selector in title_selectors:
+    for selector in _TITLE_SELECTORS:
         title_elem = soup.select_one(selector)
         if title_elem and title_elem.get_text().strip():
             legal_metadata["law_title"] = title_elem.get_text().strip()
@@ -97,22 +105,14 @@ def extract_legal_metadata(
         if "kapittel" in chapter_text.lower() or "chapter" in chapter_text.lower():
             legal_metadata["chapter"] = chapter_text
 
-    repealed_indicators = ["opphevet", "repealed", "ikrafttredelse", "endret"]
     page_text = soup.get_text().lower()
     legal_metadata["repealed"] = any(
-        indicator in page_text for indicator in repealed_indicators
+        indicator in page_text for indicator in _REPEALED_INDICATORS
     )
 
-    amendment_patterns = [
-        r"endret ved (?:lov|forskrift)[^0-9]*(\d{1,2}\s+\w+\s+\d{4})",
-        r"ikrafttredelse[^0-9]*(\d{1,2}\s+\w+\s+\d{4})",
-        r"(\d{1,2}\s+\w+\s+\d{4})[^0-9]*(?:endret|ikrafttredelse)",
-    ]
-
     amendments = []
-    for pattern in amendment_patterns:
-        matches = re.findall(pattern, page_text, re.IGNORECASE)
-        amendments.extend(matches)
+    for pattern in _AMENDMENT_RES:
+        amendments.extend(pattern.findall(page_text))
 
     if amendments:
         legal_metadata["amended_dates"] = list(set(amendments))
@@ -142,7 +142,8 @@ def enhance_section_metadata(
     processed_at = now.isoformat()
     ingested_at = metadata.get("ingested_at", now.isoformat())
 
-    token_count = len(normalized_text.split()) if normalized_text else 0
+    # normalize_text leaves single spaces between words, so count separators
+    token_count = normalized_text.count(" ") + 1 if normalized_text else 0
 
     enhanced = {
         # Original section fields
@@ -3,6 +3,7 @@ Shared utilities for Gold layer exporters.
 """
 
 import json
+import os
 from pathlib import Path
 
 
@@ -36,6 +37,32 @@ def load_json(file_path: Path) -> list[dict] | dict:  # type: ignore[return]
         return json.load(f)
 
 
+def list_files(directory: Path, suffix: str) -> list[Path]:
+    """
+    List files in a directory whose name ends with suffix.
+
+    Uses os.scandir, whose entries carry cached type info, instead of
+    Path.glob. Like glob, dotfiles are included and a missing
+    directory yields an empty list.
+
+    Args:
+        directory: Directory to scan (not recursive)
+        suffix: Filename ending to match, e.g. ".jsonl" or "_eval.jsonl"
+
+    Returns:
+        Matching file paths, sorted by name
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+
 SYSTEM_PROMPTS = {
     "tax_glossary": (
         "Du er en norsk regnskapsassistent med ekspertise innen skatt og merverdiavgift. "
@@ -7,6 +7,13 @@ All hashing uses SHA256 with UTF-8 encoding.
 
 import hashlib
 import re
+from pathlib import Path
+
+# Read size for hashing files on Pythons without hashlib.file_digest
+_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Whitespace runs collapsed by canonical hashing
+_WS_RE = re.compile(r"\s+")
 
 
 def sha256_bytes(content: bytes) -> str:
@@ -18,6 +25,25 @@ def sha256_bytes(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def sha256_file(path: Path) -> str:
+    """
+    Generate SHA256 hash of a file's contents.
+
+    Same result as sha256_bytes(path.read_bytes()), but streams the file
+    instead of holding a full copy in memory.
+
+    Used for: Bronze file hashes in the processing pipelines.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_FILE_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
 def compute_stable_hash(text: str, canonicalize: bool = False) -> str:
     """
     Generate SHA256 hash of text content.
@@ -40,8 +66,7 @@ def compute_stable_hash(text: str, canonicalize: bool = False) -> str:
         return ""
 
     if canonicalize:
-        canonical = text.lower().strip()
-        canonical = re.sub(r"\s+", " ", canonical)
+        canonical = _WS_RE.sub(" ", text.lower().strip())
         return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
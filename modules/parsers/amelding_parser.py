@@ -6,7 +6,7 @@ Extracts detailed A-melding rules and guidance from Skatteetaten and Altinn HTML
 
 import re
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from bs4 import BeautifulSoup
 from datetime import datetime
 
@@ -54,13 +54,13 @@ class AmeldingRule:
 
 
 def parse_amelding_overview(
-    html: str, source_url: str, sha256: str
+    html: Union[str, bytes], source_url: str, sha256: str
 ) -> List[AmeldingRule]:
     """
     Parse A-meldingen overview page from Skatteetaten with detailed extraction.
 
     Args:
-        html: Raw HTML content
+        html: Raw HTML content (str, or bytes as read from Bronze)
         source_url: Source URL for metadata
         sha256: Content hash for metadata
 
@@ -87,12 +87,14 @@ def parse_amelding_overview(
     return rules
 
 
-def parse_amelding_forms(html: str, source_url: str, sha256: str) -> List[AmeldingRule]:
+def parse_amelding_forms(
+    html: Union[str, bytes], source_url: str, sha256: str
+) -> List[AmeldingRule]:
     """
     Parse A-meldingen forms page from Altinn with detailed extraction.
 
     Args:
-        html: Raw HTML content
+        html: Raw HTML content (str, or bytes as read from Bronze)
         source_url: Source URL for metadata
         sha256: Content hash for metadata
 
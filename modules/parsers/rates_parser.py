@@ -5,11 +5,56 @@ Extracts VAT rates and their validity periods from HTML content.
 """
 
 import re
+import threading
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
+from lxml import etree
+
+# Patterns are compiled once; the row and text extractors run them per cell
+_PERCENT_RE = re.compile(r"(\d+[,\s]*\d*)\s*%")
+_DATE_RE = re.compile(r"(\d{1,2}[./-]\d{1,2}[./-]\d{2,4})")
+_DATE_FORMATS = ("%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d")
+_WHITESPACE_RE = re.compile(r"\s+")
+_EXCEPTION_RE = re.compile(r"(?:unntatt|bortsett fra)\s+([^.]*)")
+_NOTES_RE = re.compile(r"[*]\s*([^.]*)")
+_CONTENT_CLASS_RE = re.compile(r"content|main|article")
+_RATE_CLASS_RE = re.compile(r"rate|sats|mva")
+_RATE_HREF_RE = re.compile(r"satser|mva.*sats")
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+_thread_local = threading.local()
+
+
+def _html_parser() -> etree.HTMLParser:
+    """Return this thread's HTML parser; lxml parsers are not thread-safe."""
+    parser = getattr(_thread_local, "html_parser", None)
+    if parser is None:
+        parser = etree.HTMLParser(recover=True, encoding="utf-8")
+        _thread_local.html_parser = parser
+    return parser
+
+
+def _get_text(element: etree._Element) -> str:
+    """Join an element's stripped text nodes with spaces, skipping empty ones."""
+    parts: List[str] = []
+
+    def collect(node: etree._Element) -> None:
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            collect(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    collect(element)
+    return " ".join(text for text in (part.strip() for part in parts) if text)
+
 
 @dataclass
 class VatRate:
@@ -40,45 +85,50 @@ class VatRate:
             self.last_updated = datetime.now().isoformat()
 
 
-def parse_mva_rates(html: str, source_url: str, sha256: str) -> List[VatRate]:
+def parse_mva_rates(
+    html: Union[str, bytes], source_url: str, sha256: str
+) -> List[VatRate]:
     """
     Parse MVA rates from Skatteetaten HTML content with detailed extraction.
 
     Args:
-        html: Raw HTML content
+        html: Raw HTML content (str, or bytes as read from Bronze)
         source_url: Source URL for metadata
         sha256: Content hash for metadata
 
     Returns:
         List of VatRate objects with detailed information
     """
-    soup = BeautifulSoup(html, "lxml")
+    if isinstance(html, str):
+        # lxml rejects str with an XML encoding declaration; the parser is
+        # fixed to UTF-8, so encoded text parses the same either way
+        html = html.encode("utf-8")
+    # The whole tree is built rather than streamed: <main> scoping and the
+    # section and link passes below need elements outside the table rows
+    root = etree.fromstring(html, _html_parser()) if html else None
+    if root is None:
+        return []
     rates: List[VatRate] = []
 
     # Look for main content area
-    main_content = soup.find("main") or soup.find(
-        "div", class_=re.compile(r"content|main|article")
-    )
-    if not main_content:
-        main_content = soup
+    main_content = next(root.iter("main"), None)
+    if main_content is None:
+        main_content = next(
+            (
+                div
+                for div in root.iter("div")
+                if _CONTENT_CLASS_RE.search(div.get("class", ""))
+            ),
+            root,
+        )
 
     # Extract detailed rate information from tables
-    if hasattr(main_content, "find_all"):
-        tables = main_content.find_all("table")
-    else:
-        tables = []
-
-    for table in tables:
-        if hasattr(table, "find_all"):
-            rows = table.find_all("tr")
-        else:
-            rows = []
-
-        for row in rows:
-            cells = row.find_all(["td", "th"])
+    for table in main_content.iterdescendants("table"):
+        for row in table.iterdescendants("tr"):
+            cells = list(row.iterdescendants("td", "th"))
             if len(cells) >= 2:
                 # Extract text from cells
-                cols = [cell.get_text(" ", strip=True) for cell in cells]
+                cols = [_get_text(cell) for cell in cells]
 
                 # Skip header rows
                 if any(
@@ -93,15 +143,10 @@ def parse_mva_rates(html: str, source_url: str, sha256: str) -> List[VatRate]:
                     rates.append(rate_info)
 
     # Extract additional rate information from text content
-    if hasattr(main_content, "find_all"):
-        rate_sections = main_content.find_all(
-            ["div", "section", "p"], class_=re.compile(r"rate|sats|mva")
-        )
-    else:
-        rate_sections = []
-
-    for section in rate_sections:
-        text = section.get_text(" ", strip=True)
+    for section in main_content.iterdescendants("div", "section", "p"):
+        if not _RATE_CLASS_RE.search(section.get("class", "")):
+            continue
+        text = _get_text(section)
         if any(
             keyword in text.lower()
             for keyword in ["%", "prosent", "sats", "merverdiavgift"]
@@ -111,18 +156,15 @@ def parse_mva_rates(html: str, source_url: str, sha256: str) -> List[VatRate]:
                 rates.append(rate_info)
 
     # Extract special rate information from links and additional content
-    if hasattr(main_content, "find_all"):
-        rate_links = main_content.find_all("a", href=re.compile(r"satser|mva.*sats"))
-    else:
-        rate_links = []
-
-    for link in rate_links:
-        link_text = link.get_text(" ", strip=True)
+    for link in main_content.iterdescendants("a"):
+        if not _RATE_HREF_RE.search(link.get("href", "")):
+            continue
+        link_text = _get_text(link)
         if any(keyword in link_text.lower() for keyword in ["sats", "rate", "mva"]):
             # Try to find associated content
-            parent_section = link.find_parent(["div", "section", "p"])
-            if parent_section:
-                context = parent_section.get_text(" ", strip=True)
+            parent_section = next(link.iterancestors("div", "section", "p"), None)
+            if parent_section is not None:
+                context = _get_text(parent_section)
                 rate_info = extract_rate_from_detailed_text(context, source_url, sha256)
                 if rate_info:
                     rates.append(rate_info)
@@ -145,7 +187,7 @@ def extract_detailed_rate_from_row(
 
     for i, col in enumerate(cols):
         # Look for percentage pattern
-        match = re.search(r"(\d+[,\s]*\d*)\s*%", col)
+        match = _PERCENT_RE.search(col)
         if match:
             percentage_str = match.group(1)
             percentage_str = percentage_str.replace(",", ".")
@@ -204,7 +246,7 @@ def extract_rate_from_detailed_text(
 ) -> Optional[VatRate]:
     """Extract rate information from detailed text content."""
     # Look for percentage pattern
-    match = re.search(r"(\d+[,\s]*\d*)\s*%", text)
+    match = _PERCENT_RE.search(text)
     if not match:
         return None
 
@@ -303,7 +345,7 @@ def create_detailed_description(
 ) -> str:
     """Create detailed description for the rate."""
     # Clean up description
-    clean_desc = re.sub(r"\s+", " ", description.strip())
+    clean_desc = _WHITESPACE_RE.sub(" ", description.strip())
 
     # Create detailed description based on category
     if category == "food_products":
@@ -372,7 +414,7 @@ def extract_exceptions_from_description(description: str) -> List[str]:
     # Look for exception patterns
     if "unntatt" in desc_lower or "bortsett fra" in desc_lower:
         # Try to extract exception text
-        exception_match = re.search(r"(?:unntatt|bortsett fra)\s+([^.]*)", desc_lower)
+        exception_match = _EXCEPTION_RE.search(desc_lower)
         if exception_match:
             exceptions.append(exception_match.group(1).strip())
 
@@ -390,7 +432,7 @@ def extract_exceptions_from_description(description: str) -> List[str]:
 def extract_notes_from_description(description: str) -> str:
     """Extract additional notes from description."""
     # Look for notes in parentheses or after asterisks
-    notes_match = re.search(r"[*]\s*([^.]*)", description)
+    notes_match = _NOTES_RE.search(description)
     if notes_match:
         return notes_match.group(1).strip()
 
@@ -412,7 +454,7 @@ def extract_rate_from_row(cols: List[str]) -> Optional[Dict[str, Any]]:
 
     for col in cols:
         # Look for percentage pattern
-        match = re.search(r"(\d+[,\s]*\d*)\s*%", col)
+        match = _PERCENT_RE.search(col)
         if match:
             percentage_str = match.group(1)
             # Convert to float, handling both comma and dot as decimal separator
@@ -450,7 +492,7 @@ def extract_rate_from_row(cols: List[str]) -> Optional[Dict[str, Any]]:
 def extract_rate_from_text(text: str) -> Optional[Dict[str, Any]]:
     """Extract rate information from text content."""
     # Look for percentage pattern
-    match = re.search(r"(\d+[,\s]*\d*)\s*%", text)
+    match = _PERCENT_RE.search(text)
     if not match:
         return None
 
@@ -507,13 +549,13 @@ def extract_validity_dates(cols: List[str]) -> tuple[Optional[str], Optional[str
 
     for col in cols:
         # Look for date patterns
-        date_match = re.search(r"(\d{1,2}[./-]\d{1,2}[./-]\d{2,4})", col)
+        date_match = _DATE_RE.search(col)
         if date_match:
             date_str = date_match.group(1)
             # Normalize date format
             try:
                 # Try different date formats
-                for fmt in ["%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d"]:
+                for fmt in _DATE_FORMATS:
                     try:
                         parsed_date = datetime.strptime(date_str, fmt).date()
                         if valid_from is None:
@@ -6,23 +6,56 @@ Extracts detailed technical specifications from SAF-T PDF documents.
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
 import requests
 from datetime import datetime
 
+from ..hash_utils import sha256_bytes
+from ..logger import logger
+
 try:
     import fitz  # PyMuPDF
     import pdfplumber
     from pypdf import PdfReader
 except ImportError:
-    from ..logger import logger
-
     logger.error(
         "PDF parsing libraries not available. Install with: uv add pypdf pdfplumber pymupdf"
     )
     raise
 
+# Lookup tables and patterns for the per-node helpers, built once at import
+_CARDINALITY_ALIASES = {
+    "1": "1..1",
+    "1..1": "1..1",
+    "1-1": "1..1",
+    "0..1": "0..1",
+    "0-1": "0..1",
+    "0,1": "0..1",
+    "1..*": "1..*",
+    "1-*": "1..*",
+    "1+": "1..*",
+    "1,*": "1..*",
+    "0..*": "0..*",
+    "0-*": "0..*",
+    "0,*": "0..*",
+    "*": "0..*",
+}
+
+# Checked in order: the first type with any keyword in the text wins
+_DATA_TYPE_PATTERNS = (
+    ("date", re.compile("date|dato|time|tid")),
+    ("decimal", re.compile("amount|beløp|sum|money|currency")),
+    ("integer", re.compile("number|tall|count|antall")),
+    ("boolean", re.compile("boolean|true|false|yes|no")),
+    ("complex", re.compile("complex|group|element|container")),
+)
+
+_LENGTH_RE = re.compile(r"(\d+)\s*(?:characters?|chars?|tegn)", re.IGNORECASE)
+_PATTERN_RE = re.compile(r"pattern[:\s]+([^\s,]+)", re.IGNORECASE)
+_FORMAT_RE = re.compile(r"format[:\s]+([^\s,]+)", re.IGNORECASE)
+
 
 @dataclass
 class SpecNode:
@@ -89,8 +122,6 @@ class SAFTPDFParser:
 
             return pdf_path
         except Exception as e:
-            from ..logger import logger
-
             logger.error(f"Failed to download PDF {url}: {e}")
             return None
 
@@ -105,8 +136,6 @@ class SAFTPDFParser:
                 text += page.get_text() + "\n"
             doc.close()
         except Exception as e:
-            from ..logger import logger
-
             logger.warning(f"PyMuPDF failed: {e}")
 
         # Method 2: pdfplumber - good for tables and structured content
@@ -118,8 +147,6 @@ class SAFTPDFParser:
                         if page_text:
                             text += page_text + "\n"
             except Exception as e:
-                from ..logger import logger
-
                 logger.warning(f"pdfplumber failed: {e}")
 
         # Method 3: pypdf - fallback
@@ -130,8 +157,6 @@ class SAFTPDFParser:
                     for page in reader.pages:
                         text += page.extract_text() + "\n"
             except Exception as e:
-                from ..logger import logger
-
                 logger.warning(f"pypdf failed: {e}")
 
         return text
@@ -146,8 +171,6 @@ class SAFTPDFParser:
                     if page_tables:
                         tables.extend(page_tables)
         except Exception as e:
-            from ..logger import logger
-
             logger.warning(f"Table extraction failed: {e}")
         return tables
 
@@ -285,8 +308,6 @@ class SAFTPDFParser:
             return nodes
 
         # Debug: print table structure
-        from ..logger import logger
-
         logger.debug(f"Table with {len(table)} rows:")
         for i, row in enumerate(table[:3]):  # Show first 3 rows
             if row:  # Check if row is not None
@@ -327,8 +348,6 @@ class SAFTPDFParser:
             elif any(word in header_lower for word in ["type", "datatype", "format"]):
                 type_col = i
 
-        from ..logger import logger
-
         logger.debug(
             f"Detected columns - Path: {path_col}, Req: {req_col}, Cardinality: {cardinality_col}, Description: {description_col}, Type: {type_col}"
         )
@@ -396,14 +415,10 @@ class SAFTPDFParser:
             )
             if node:
                 nodes.append(node)
-                from ..logger import logger
-
                 logger.debug(
                     f"  Added node: {node_path} ({cardinality}) - {description[:50]}..."
                 )
 
-        from ..logger import logger
-
         logger.debug(f"Extracted {len(nodes)} nodes from table")
         return nodes
 
@@ -460,42 +475,23 @@ class SAFTPDFParser:
         cardinality = cardinality.strip()
 
         # Handle various formats
-        if cardinality in ["1", "1..1", "1-1"]:
-            return "1..1"
-        elif cardinality in ["0..1", "0-1", "0,1"]:
-            return "0..1"
-        elif cardinality in ["1..*", "1-*", "1+", "1,*"]:
-            return "1..*"
-        elif cardinality in ["0..*", "0-*", "0,*", "*"]:
-            return "0..*"
+        if cardinality in _CARDINALITY_ALIASES:
+            return _CARDINALITY_ALIASES[cardinality]
         elif ".." in cardinality or "-" in cardinality:
             return cardinality.replace("-", "..")
         else:
             return "1..1"  # Default
 
-    def _determine_data_type_from_text(self, text: str) -> str:
-        """Determine data type from text description."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _determine_data_type_from_text(text: str) -> str:
+        """Determine data type from text description (memoized per text)."""
         text_lower = text.lower()
 
-        if any(word in text_lower for word in ["date", "dato", "time", "tid"]):
-            return "date"
-        elif any(
-            word in text_lower
-            for word in ["amount", "beløp", "sum", "money", "currency"]
-        ):
-            return "decimal"
-        elif any(word in text_lower for word in ["number", "tall", "count", "antall"]):
-            return "integer"
-        elif any(
-            word in text_lower for word in ["boolean", "true", "false", "yes", "no"]
-        ):
-            return "boolean"
-        elif any(
-            word in text_lower for word in ["complex", "group", "element", "container"]
-        ):
-            return "complex"
-        else:
-            return "string"
+        for data_type, keywords in _DATA_TYPE_PATTERNS:
+            if keywords.search(text_lower):
+                return data_type
+        return "string"
 
     def _determine_format(self, data_type: str) -> str:
         """Determine format from data type."""
@@ -513,19 +509,17 @@ class SAFTPDFParser:
         details = []
 
         # Look for length constraints
-        length_match = re.search(
-            r"(\d+)\s*(?:characters?|chars?|tegn)", text, re.IGNORECASE
-        )
+        length_match = _LENGTH_RE.search(text)
         if length_match:
             details.append(f"Max length: {length_match.group(1)}")
 
         # Look for pattern constraints
-        pattern_match = re.search(r"pattern[:\s]+([^\s,]+)", text, re.IGNORECASE)
+        pattern_match = _PATTERN_RE.search(text)
         if pattern_match:
             details.append(f"Pattern: {pattern_match.group(1)}")
 
         # Look for format specifications
-        format_match = re.search(r"format[:\s]+([^\s,]+)", text, re.IGNORECASE)
+        format_match = _FORMAT_RE.search(text)
         if format_match:
             details.append(f"Format: {format_match.group(1)}")
 
@@ -581,22 +575,16 @@ def parse_saft_pdfs_from_sources(sources: List[Dict[str, str]]) -> List[SpecNode
     }
 
     for pdf_name, pdf_url in pdf_urls.items():
-        from ..logger import logger
-
         logger.info(f"Processing {pdf_name} PDF...")
 
         # Download PDF
         pdf_path = parser.download_pdf(pdf_url, f"saft_{pdf_name}")
         if not pdf_path:
-            from ..logger import logger
-
             logger.error(f"Failed to download {pdf_name} PDF")
             continue
 
         # Parse PDF based on type
         # Compute actual PDF hash
-        from ..hash_utils import sha256_bytes
-
         pdf_content = pdf_path.read_bytes()
         pdf_hash = sha256_bytes(pdf_content)
 
@@ -611,8 +599,6 @@ def parse_saft_pdfs_from_sources(sources: List[Dict[str, str]]) -> List[SpecNode
         else:
             nodes = parser.parse_technical_description_pdf(pdf_path, pdf_url, pdf_hash)
 
-        from ..logger import logger
-
         logger.info(f"Extracted {len(nodes)} nodes from {pdf_name}")
         all_nodes.extend(nodes)
 
@@ -631,13 +617,9 @@ def main():
 
     nodes = parse_saft_pdfs_from_sources(sources)
 
-    from ..logger import logger
-
     logger.info(f"\nExtracted {len(nodes)} SAF-T nodes from PDFs")
 
     # Show sample nodes
-    from ..logger import logger
-
     for i, node in enumerate(nodes[:5]):
         logger.info(f"\nNode {i + 1}:")
         logger.info(f"  Path: {node.node_path}")
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from .processing_pipeline import ProcessingPipeline
 from ..data_io import log
+from ..hash_utils import compute_stable_hash, sha256_file
 
 
 class RatesProcessingPipeline(ProcessingPipeline):
@@ -49,8 +50,6 @@ class RatesProcessingPipeline(ProcessingPipeline):
                 # Parse rates from HTML
                 html_content = file_path.read_text(encoding="utf-8")
                 # Compute actual SHA256 hash
-                from ..hash_utils import compute_stable_hash
-
                 sha256_hash = compute_stable_hash(html_content)
                 rates = parse_mva_rates(html_content, source["url"], sha256_hash)
 
@@ -132,9 +131,7 @@ class AmeldingProcessingPipeline(ProcessingPipeline):
 
             try:
                 html_content = file_path.read_text(encoding="utf-8")
-                from ..hash_utils import sha256_bytes
-
-                bronze_hash = sha256_bytes(file_path.read_bytes())
+                bronze_hash = sha256_file(file_path)
 
                 if "overview" in source_id.lower():
                     rules = parse_amelding_overview(
@@ -234,9 +231,7 @@ class SaftProcessingPipeline(ProcessingPipeline):
 
             try:
                 html_content = file_path.read_text(encoding="utf-8")
-                from ..hash_utils import sha256_bytes
-
-                bronze_hash = sha256_bytes(file_path.read_bytes())
+                bronze_hash = sha256_file(file_path)
                 nodes = parse_saft_documentation(
                     html_content, "1.30", source["url"], bronze_hash
                 )
@@ -333,9 +328,7 @@ class LegalTextProcessingPipeline(ProcessingPipeline):
 
             try:
                 html_content = file_path.read_text(encoding="utf-8")
-                from ..hash_utils import sha256_bytes
-
-                bronze_hash = sha256_bytes(file_path.read_bytes())
+                bronze_hash = sha256_file(file_path)
                 sections = parse_lovdata_html(
                     html_content, source_id, source["url"], bronze_hash
                 )
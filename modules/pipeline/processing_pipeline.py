@@ -2,13 +2,21 @@
 Processing pipeline component for transforming data between layers.
 """
 
-import json
 from pathlib import Path
-from typing import List, Dict, Any, Callable, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Optional
+
+import orjson
 
 from .base_pipeline import BasePipeline, PipelineResult
 from .source_loader import SourceLoader
 from ..data_io import log
+from ..hash_utils import sha256_file
+
+if TYPE_CHECKING:
+    from ..parsers.lovdata_parser import Section
+
+# Indented like json.dump(indent=2); non-str keys are stringified as json does
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 class ProcessingPipeline(BasePipeline):
@@ -83,8 +91,7 @@ class ProcessingPipeline(BasePipeline):
 
         output_path = self.silver_dir / output_file
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(orjson.dumps(data, option=_JSON_OPTIONS))
             log.info(f"Saved {len(data)} items to {output_path}")
         except Exception as e:
             log.error(f"Failed to save results to {output_path}: {e}")
@@ -129,9 +136,18 @@ class ProcessingPipeline(BasePipeline):
 
 
 def process_lovdata_sources(
-    sources: List[Dict[str, str]], bronze_dir: Path, silver_dir: Path
+    sources: List[Dict[str, str]],
+    bronze_dir: Path,
+    silver_dir: Path,
+    *,
+    pre_parsed: Optional[Dict[str, List["Section"]]] = None,
 ) -> Dict[str, Any]:
-    """Process Lovdata sources from Bronze to Silver."""
+    """
+    Process Lovdata sources from Bronze to Silver.
+
+    pre_parsed maps source_id to sections already returned by
+    parse_lovdata_html; those sources skip the Bronze read and parse.
+    """
     from ..parsers.lovdata_parser import parse_lovdata_html
     from ..cleaners.legal_text_cleaner import (
         clean_legal_text,
@@ -150,19 +166,19 @@ def process_lovdata_sources(
     for source in sources:
         source_id = source["source_id"]
         file_path = bronze_dir / f"{source_id}.html"
+        sections = pre_parsed.get(source_id) if pre_parsed else None
 
-        if not file_path.exists():
+        if sections is None and not file_path.exists():
             stats["errors"].append(f"Bronze file not found: {file_path}")
             continue
 
         try:
-            html_content = file_path.read_text(encoding="utf-8")
-            from modules.hash_utils import sha256_bytes
-
-            bronze_hash = sha256_bytes(file_path.read_bytes())
-            sections = parse_lovdata_html(
-                html_content, source_id, source["url"], bronze_hash
-            )
+            if sections is None:
+                html_content = file_path.read_text(encoding="utf-8")
+                bronze_hash = sha256_file(file_path)
+                sections = parse_lovdata_html(
+                    html_content, source_id, source["url"], bronze_hash
+                )
 
             # Clean and normalize sections
             cleaned_sections = []
@@ -211,8 +227,7 @@ def process_lovdata_sources(
     # Save to silver layer
     if all_sections:
         output_file = silver_dir / "law_sections.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(all_sections, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(all_sections, option=_JSON_OPTIONS))
         log.info(f"Saved {len(all_sections)} sections to {output_file}")
 
     return stats
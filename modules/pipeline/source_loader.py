@@ -28,10 +28,14 @@ class SourceLoader:
             return sources
 
         try:
-            with open(self.sources_file, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+            with open(self.sources_file, "r", encoding="utf-8", newline="") as f:
+                # Plain csv.reader + one shared header avoids DictReader's
+                # per-row bookkeeping; rows are zipped straight into dicts.
+                reader = csv.reader(f)
+                header = next(reader, [])
                 for row in reader:
-                    sources.append(row)
+                    if row:
+                        sources.append(dict(zip(header, row)))
 
             log.info(f"Loaded {len(sources)} sources from {self.sources_file}")
             self._sources_cache = sources
@@ -3,7 +3,8 @@ Consolidated schema definitions for all data types.
 Pydantic V2 models for Bronze, Silver, and Gold layers.
 """
 
-from typing import List, Literal, Optional, Union
+from functools import cache
+from typing import Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -51,7 +52,7 @@ class LawSection(BaseModel):
     token_count: Optional[int] = Field(None, description="Token count for LLM")
     crawl_freq: Optional[str] = Field(None, description="Crawl frequency")
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, frozen=True, defer_build=True)
 
 
 class VatRate(BaseModel):
@@ -73,7 +74,7 @@ class VatRate(BaseModel):
     token_count: Optional[int] = None
     crawl_freq: Optional[str] = None
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, frozen=True, defer_build=True)
 
 
 class SpecNode(BaseModel):
@@ -101,7 +102,7 @@ class SpecNode(BaseModel):
     token_count: Optional[int] = None
     crawl_freq: Optional[str] = None
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, frozen=True, defer_build=True)
 
 
 class AmeldingRule(BaseModel):
@@ -128,7 +129,7 @@ class AmeldingRule(BaseModel):
     token_count: Optional[int] = None
     crawl_freq: Optional[str] = None
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, frozen=True, defer_build=True)
 
 
 class QualityReport(BaseModel):
@@ -145,7 +146,7 @@ class QualityReport(BaseModel):
     recommendations: List[str] = Field(default_factory=list)
     assessment_date: str
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class SilverMetadata(BaseModel):
@@ -161,7 +162,7 @@ class SilverMetadata(BaseModel):
     publishers: List[str]
     quality_score: float
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class ChartOfAccountsEntry(BaseModel):
@@ -202,7 +203,7 @@ class ChartOfAccountsEntry(BaseModel):
     jurisdiction: str = Field(default="NO", description="Jurisdiction")
     last_updated: Optional[str] = Field(None, description="Last updated timestamp")
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class RuleCondition(BaseModel):
@@ -225,7 +226,7 @@ class RuleCondition(BaseModel):
         ..., description="Value to compare against"
     )
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class RuleAction(BaseModel):
@@ -241,7 +242,7 @@ class RuleAction(BaseModel):
     ] = Field(..., description="Action type")
     value: Union[str, int, float] = Field(..., description="Action value")
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class ExampleInput(BaseModel):
@@ -254,7 +255,7 @@ class ExampleInput(BaseModel):
     context: str | None = None
     supplier_vat_registered: bool | None = None
 
-    model_config = ConfigDict(extra="allow", json_encoders={})
+    model_config = ConfigDict(extra="allow", json_encoders={}, defer_build=True)
 
 
 class ExampleOutput(BaseModel):
@@ -266,7 +267,7 @@ class ExampleOutput(BaseModel):
     vat_account: str | None = None
     posting_type: str | None = None
 
-    model_config = ConfigDict(extra="allow", json_encoders={})
+    model_config = ConfigDict(extra="allow", json_encoders={}, defer_build=True)
 
 
 class RuleExample(BaseModel):
@@ -276,7 +277,7 @@ class RuleExample(BaseModel):
     input: ExampleInput
     output: ExampleOutput
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class BusinessRule(BaseModel):
@@ -320,7 +321,7 @@ class BusinessRule(BaseModel):
             raise ValueError("source_ids cannot be empty")
         return v
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class GoldMessage(BaseModel):
@@ -329,7 +330,7 @@ class GoldMessage(BaseModel):
     role: Literal["system", "user", "assistant"]
     content: str = Field(..., min_length=1, description="Message content")
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class GoldMetadata(BaseModel):
@@ -345,7 +346,7 @@ class GoldMetadata(BaseModel):
     turns: int | None = None
     created_at: str | None = None
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
 
 
 class GoldTrainingSample(BaseModel):
@@ -364,7 +365,17 @@ class GoldTrainingSample(BaseModel):
             raise ValueError("First message must be system")
         return v
 
-    model_config = ConfigDict(json_encoders={})
+    model_config = ConfigDict(json_encoders={}, defer_build=True)
+
+
+@cache
+def cached_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Return the JSON Schema for a model, generated once per class.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return model.model_json_schema()
 
 
 __all__ = [
@@ -384,4 +395,5 @@ __all__ = [
     "GoldMessage",
     "GoldMetadata",
     "GoldTrainingSample",
+    "cached_json_schema",
 ]
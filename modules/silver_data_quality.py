@@ -3,7 +3,8 @@ Silver layer data quality validation.
 Validates data quality aspects like URLs, hashes, domains, and generates quality scores.
 """
 
-from typing import Dict, List, Any
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Any
 from datetime import datetime
 import re
 from urllib.parse import urlparse
@@ -13,6 +14,61 @@ MAX_QUALITY_SCORE = 10
 QUALITY_SCORE_EXCELLENT = 8
 QUALITY_SCORE_ACCEPTABLE = 6
 
+# Per-record checks use these prebuilt constants instead of rebuilding them
+_REQUIRED_FIELDS = ("source_url", "sha256", "domain", "publisher")
+_VALID_DOMAINS = frozenset({"tax", "accounting", "reporting"})
+_SHA256_RE = re.compile(r"^[a-f0-9]{64}$")
+
+
+@dataclass
+class QualityTally:
+    """Running quality counters, fed one batch of records at a time.
+
+    Lets large files be scored while streaming, without holding every
+    record in memory; only the first few missing-field issues are kept.
+    """
+
+    total_records: int = 0
+    missing_fields: List[str] = field(default_factory=list)
+    invalid_urls: int = 0
+    invalid_hashes: int = 0
+    invalid_domains: int = 0
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Add a batch of records to the counters."""
+        for record in records:
+            i = self.total_records
+            self.total_records += 1
+
+            for name in _REQUIRED_FIELDS:
+                missing = name not in record or not record[name]
+                if missing and len(self.missing_fields) < MAX_SHOWN_ERRORS:
+                    self.missing_fields.append(f"Record {i} missing {name}")
+
+            source_url = record.get("source_url")
+            if source_url and not _is_valid_url(source_url):
+                self.invalid_urls += 1
+
+            sha256 = record.get("sha256")
+            if sha256 and not _is_valid_sha256(sha256):
+                self.invalid_hashes += 1
+
+            domain = record.get("domain")
+            if domain and domain not in _VALID_DOMAINS:
+                self.invalid_domains += 1
+
+    def result(self) -> Dict[str, Any]:
+        """Build the quality report from the counters."""
+        if not self.total_records:
+            return {
+                "is_valid": False,
+                "quality_score": 0.0,
+                "issues": ["Dataset is empty"],
+                "recommendations": ["Add data to the dataset"],
+            }
+
+        return _build_quality_report(self)
+
 
 def validate_silver_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -24,69 +80,36 @@ def validate_silver_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Dictionary with validation results
     """
-    if not data:
-        return {
-            "is_valid": False,
-            "quality_score": 0.0,
-            "issues": ["Dataset is empty"],
-            "recommendations": ["Add data to the dataset"],
-        }
+    tally = QualityTally()
+    tally.update(data)
+    return tally.result()
 
-    return _validate_data_content(data)
 
-
-def _validate_data_content(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Validate the content of the data."""
+def _build_quality_report(tally: QualityTally) -> Dict[str, Any]:
+    """Turn the collected counters into issues, a score and recommendations."""
     issues = []
     recommendations = []
 
-    required_fields = ["source_url", "sha256", "domain", "publisher"]
-    missing_fields = []
-
-    for i, record in enumerate(data):
-        for field in required_fields:
-            if field not in record or not record[field]:
-                missing_fields.append(f"Record {i} missing {field}")
-
-    if missing_fields:
-        issues.extend(missing_fields[:MAX_SHOWN_ERRORS])
+    if tally.missing_fields:
+        issues.extend(tally.missing_fields)
         recommendations.append("Fill in missing required fields")
 
     quality_issues = []
 
-    invalid_urls = 0
-    for record in data:
-        if "source_url" in record and record["source_url"]:
-            if not _is_valid_url(record["source_url"]):
-                invalid_urls += 1
-
-    if invalid_urls > 0:
-        quality_issues.append(f"Found {invalid_urls} invalid URLs")
+    if tally.invalid_urls > 0:
+        quality_issues.append(f"Found {tally.invalid_urls} invalid URLs")
         recommendations.append("Fix invalid URLs")
 
-    invalid_hashes = 0
-    for record in data:
-        if "sha256" in record and record["sha256"]:
-            if not _is_valid_sha256(record["sha256"]):
-                invalid_hashes += 1
-
-    if invalid_hashes > 0:
-        quality_issues.append(f"Found {invalid_hashes} invalid SHA256 hashes")
+    if tally.invalid_hashes > 0:
+        quality_issues.append(f"Found {tally.invalid_hashes} invalid SHA256 hashes")
         recommendations.append("Fix invalid SHA256 hashes")
 
-    invalid_domains = 0
-    valid_domains = {"tax", "accounting", "reporting"}
-    for record in data:
-        if "domain" in record and record["domain"]:
-            if record["domain"] not in valid_domains:
-                invalid_domains += 1
-
-    if invalid_domains > 0:
-        quality_issues.append(f"Found {invalid_domains} invalid domains")
+    if tally.invalid_domains > 0:
+        quality_issues.append(f"Found {tally.invalid_domains} invalid domains")
         recommendations.append("Use valid domains: tax, accounting, reporting")
 
     total_issues = len(issues) + len(quality_issues)
-    max_issues = len(data) * 2
+    max_issues = tally.total_records * 2
     quality_score = (
         max(0, MAX_QUALITY_SCORE - (total_issues / max_issues) * MAX_QUALITY_SCORE)
         if max_issues > 0
@@ -110,7 +133,7 @@ def _validate_data_content(data: List[Dict[str, Any]]) -> Dict[str, Any]:
         "quality_score": round(quality_score, 2),
         "issues": issues,
         "recommendations": recommendations,
-        "total_records": len(data),
+        "total_records": tally.total_records,
         "assessment_timestamp": datetime.now().isoformat(),
     }
 
@@ -126,4 +149,4 @@ def _is_valid_url(url: str) -> bool:
 
 def _is_valid_sha256(hash_str: str) -> bool:
     """Check if string is a valid SHA256 hash."""
-    return bool(re.match(r"^[a-f0-9]{64}$", hash_str.lower()))
+    return bool(_SHA256_RE.match(hash_str.lower()))
@@ -17,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from modules.exporters.utils import list_files
 from modules.logger import get_logger
 
 logger = get_logger(__name__)
@@ -356,7 +357,7 @@ def main() -> None:
     if args.eval_files:
         eval_files = [Path(f) for f in args.eval_files]
     else:
-        eval_files = list(args.eval_dir.glob("*_eval.jsonl"))
+        eval_files = list_files(args.eval_dir, "_eval.jsonl")
 
     if not eval_files:
         logger.error(f"No eval files found in {args.eval_dir}")
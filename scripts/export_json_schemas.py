@@ -20,6 +20,7 @@ from modules.schemas import (
     RuleExample,
     SpecNode,
     VatRate,
+    cached_json_schema,
 )
 
 
@@ -58,7 +59,7 @@ def export_json_schemas(output_dir: Path | None = None) -> int:
 
     for name, model_class in schemas_to_export.items():
         try:
-            schema = model_class.model_json_schema()  # type: ignore[attr-defined]
+            schema = cached_json_schema(model_class)
             output_path = output_dir / f"{name}.schema.json"
 
             with output_path.open("w", encoding="utf-8") as f:
@@ -5,11 +5,21 @@ Silver layer validation script with quality assessment.
 
 import argparse
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import groupby, islice, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type
 
-from modules.silver_data_quality import validate_silver_data
+import ijson
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from modules.silver_data_quality import QualityTally
 from modules.schemas import (
     LawSection,
     SpecNode,
@@ -18,6 +28,39 @@ from modules.schemas import (
 )
 from modules.logger import logger
 
+# Files above this size are streamed with ijson instead of loaded whole
+STREAM_THRESHOLD_BYTES = 100 * 1024 * 1024
+STREAM_CHUNK_SIZE = 10_000
+
+# Only this many validation errors per file are formatted and reported
+MAX_REPORTED_ERRORS = 5
+
+# Expected Silver files and the schema of the records each one holds
+SILVER_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "law_sections.json": LawSection,
+    "saft_v1_3_nodes.json": SpecNode,
+    "amelding_rules.json": AmeldingRule,
+    "rate_table.json": VatRate,
+}
+
+# Below this combined file size, starting worker processes (each of which
+# re-imports pydantic) costs more than validating inline
+POOL_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# List adapters per Silver file, built once per process by _init_worker
+_ADAPTERS: Dict[str, TypeAdapter[Any]] = {}
+
+
+def _init_worker() -> None:
+    """Build the TypeAdapters for every Silver file in this process.
+
+    Used as the ProcessPoolExecutor initializer so each worker pays the
+    schema build once, not once per file; a no-op if already built.
+    """
+    for filename, schema in SILVER_SCHEMAS.items():
+        if filename not in _ADAPTERS:
+            _ADAPTERS[filename] = TypeAdapter(List[schema])  # type: ignore[valid-type]
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Validate Silver layer data")
@@ -32,110 +75,246 @@ def parse_args():
         type=str,
         help="Output file for quality report (optional)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Worker processes for file validation "
+            "(default: inline, or one per file for large inputs)"
+        ),
+    )
     return parser.parse_args()
 
 
-def validate_silver_files(silver_dir: Path) -> Dict[str, Any]:
-    """Validate Silver layer files with Pydantic schemas and quality assessment."""
+def _load_json(path: Path) -> Any:
+    """Parse a Silver JSON file straight from bytes (orjson is always UTF-8)."""
+    return orjson.loads(path.read_bytes())
 
-    results: dict[str, Any] = {
-        "total_files": 0,
-        "valid_files": 0,
-        "invalid_files": 0,
-        "validation_failed": False,
-        "quality_issues": False,
-        "file_details": {},
-        "overall_quality_score": 0.0,
-        "quality_recommendations": [],
-    }
 
-    # Define schema mapping
-    schema_map = {
-        "law_sections.json": LawSection,
-        "saft_v1_3_nodes.json": SpecNode,
-        "amelding_rules.json": AmeldingRule,
-        "rate_table.json": VatRate,
-    }
+def _load_chunks(file_path: Path) -> Optional[Iterable[List[Any]]]:
+    """Return a file's records in validation chunks, or None if not a JSON list.
 
-    # Check each expected file
-    for filename, schema_class in schema_map.items():
-        file_path = silver_dir / filename
-        results["total_files"] += 1
+    Files up to STREAM_THRESHOLD_BYTES are parsed whole with orjson and form a
+    single chunk. Larger files are streamed with ijson so only
+    STREAM_CHUNK_SIZE records are held in memory at a time.
+    """
+    if file_path.stat().st_size <= STREAM_THRESHOLD_BYTES:
+        data = _load_json(file_path)
+        return [data] if isinstance(data, list) else None
 
-        if not file_path.exists():
-            logger.warning(f"Missing file: {filename}")
-            results["invalid_files"] += 1
-            results["validation_failed"] = True
-            results["file_details"][filename] = {
+    if not _starts_with_array(file_path):
+        return None
+    return _stream_chunks(file_path)
+
+
+def _starts_with_array(file_path: Path) -> bool:
+    """Check whether the top-level JSON value in the file is an array."""
+    with open(file_path, "rb") as f:
+        while byte := f.read(1):
+            if not byte.isspace():
+                return byte == b"["
+    return False
+
+
+def _stream_chunks(file_path: Path) -> Iterator[List[Any]]:
+    """Yield the items of a top-level JSON array in STREAM_CHUNK_SIZE lists."""
+    with open(file_path, "rb") as f:
+        records = ijson.items(f, "item", use_float=True)
+        while chunk := list(islice(records, STREAM_CHUNK_SIZE)):
+            yield chunk
+
+
+def _validate_chunks(
+    chunks: Iterable[List[Any]], adapter: TypeAdapter[Any]
+) -> Tuple[int, List[str], QualityTally]:
+    """Validate chunks against the adapter and tally quality as they pass.
+
+    Returns the total error count and formatted messages for only the first
+    MAX_REPORTED_ERRORS errors; the rest are counted but never formatted.
+    Quality counters stop once a validation error is seen, since invalid
+    files are not scored.
+    """
+    error_count = 0
+    first_errors: List[Tuple[int, ErrorDetails]] = []
+    tally = QualityTally()
+    offset = 0
+
+    for chunk in chunks:
+        # Validate the whole chunk in one call; errors carry the item index
+        try:
+            adapter.validate_python(chunk)
+        except ValidationError as e:
+            error_count += e.error_count()
+            room = MAX_REPORTED_ERRORS - len(first_errors)
+            if room > 0:
+                first_errors.extend(
+                    (offset, err) for err in e.errors(include_url=False)[:room]
+                )
+
+        if not error_count:
+            tally.update(chunk)
+        offset += len(chunk)
+
+    return (
+        error_count,
+        [_format_error(err, start) for start, err in first_errors],
+        tally,
+    )
+
+
+def _validate_file(
+    filename: str, silver_dir: Path
+) -> Tuple[str, Dict[str, Any], List[str]]:
+    """Validate one Silver file; returns (filename, details, recommendations).
+
+    Module-level so it can be pickled and run in a worker process.
+    """
+    file_path = silver_dir / filename
+
+    if not file_path.exists():
+        logger.warning(f"Missing file: {filename}")
+        return (
+            filename,
+            {
                 "status": "missing",
                 "errors": ["File not found"],
                 "quality_score": 0.0,
-            }
-            continue
+            },
+            [],
+        )
 
-        try:
-            # Load and validate file
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    try:
+        # Load and validate file
+        chunks = _load_chunks(file_path)
 
-            if not isinstance(data, list):
-                logger.error(
-                    f"Invalid format in {filename}: expected list, got {type(data)}"
-                )
-                results["invalid_files"] += 1
-                results["validation_failed"] = True
-                results["file_details"][filename] = {
+        if chunks is None:
+            logger.error(f"Invalid format in {filename}: expected list")
+            return (
+                filename,
+                {
                     "status": "invalid",
                     "errors": ["Invalid JSON format"],
                     "quality_score": 0.0,
-                }
-                continue
-
-            # Validate each item using Pydantic
-            validation_errors = []
-            for i, item in enumerate(data):
-                try:
-                    schema_class(**item)
-                except Exception as e:
-                    validation_errors.append(f"Item {i}: {str(e)}")
-
-            if validation_errors:
-                logger.error(
-                    f"Validation errors in {filename}: {len(validation_errors)} errors"
-                )
-                results["invalid_files"] += 1
-                results["validation_failed"] = True
-                results["file_details"][filename] = {
+                },
+                [],
+            )
+
+        error_count, validation_errors, tally = _validate_chunks(
+            chunks, _ADAPTERS[filename]
+        )
+
+        if error_count:
+            logger.error(f"Validation errors in {filename}: {error_count} errors")
+            return (
+                filename,
+                {
                     "status": "invalid",
-                    "errors": validation_errors[:5],  # Show first 5 errors
+                    "errors": validation_errors,  # First MAX_REPORTED_ERRORS
+                    "error_count": error_count,
                     "quality_score": 0.0,
-                }
-            else:
-                quality_result = validate_silver_data(data)
-                results["valid_files"] += 1
-                results["file_details"][filename] = {
-                    "status": "valid",
-                    "errors": [],
-                    "quality_score": quality_result.get("quality_score", 0.0),
-                    "quality_issues": quality_result.get("issues", []),
-                }
-
-                # Track overall quality
-                if quality_result.get("issues"):
-                    results["quality_issues"] = True
-                    results["quality_recommendations"].extend(
-                        quality_result.get("recommendations", [])
-                    )
+                },
+                [],
+            )
 
-        except Exception as e:
-            logger.error(f"Error processing {filename}: {str(e)}")
-            results["invalid_files"] += 1
-            results["validation_failed"] = True
-            results["file_details"][filename] = {
+        # Quality counters were filled from the already-validated dicts;
+        # no models are rebuilt
+        quality_result = tally.result()
+        recommendations = (
+            quality_result.get("recommendations", [])
+            if quality_result.get("issues")
+            else []
+        )
+        return (
+            filename,
+            {
+                "status": "valid",
+                "errors": [],
+                "quality_score": quality_result.get("quality_score", 0.0),
+                "quality_issues": quality_result.get("issues", []),
+            },
+            recommendations,
+        )
+
+    except Exception as e:
+        logger.error(f"Error processing {filename}: {str(e)}")
+        return (
+            filename,
+            {
                 "status": "error",
                 "errors": [str(e)],
                 "quality_score": 0.0,
-            }
+            },
+            [],
+        )
+
+
+def _default_workers(filenames: List[str], silver_dir: Path) -> int:
+    """Inline (1) for small inputs, else one worker per file."""
+    total_bytes = sum(
+        path.stat().st_size
+        for path in (silver_dir / name for name in filenames)
+        if path.is_file()
+    )
+    if total_bytes < POOL_THRESHOLD_BYTES:
+        return 1
+    return min(len(filenames), os.cpu_count() or 1)
+
+
+def validate_silver_files(
+    silver_dir: Path, max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """Validate Silver layer files with Pydantic schemas and quality assessment.
+
+    Files are independent, so large inputs (POOL_THRESHOLD_BYTES combined)
+    are validated in a process pool with one worker per file. Smaller
+    inputs run inline. max_workers overrides this: 1 runs inline, more
+    than 1 always uses the pool.
+
+    The returned dict is the report main() saves with --output. Invalid
+    files list their first MAX_REPORTED_ERRORS messages under "errors" and
+    the total number of errors under "error_count".
+    """
+
+    results: dict[str, Any] = {
+        "total_files": 0,
+        "valid_files": 0,
+        "invalid_files": 0,
+        "validation_failed": False,
+        "quality_issues": False,
+        "file_details": {},
+        "overall_quality_score": 0.0,
+        "quality_recommendations": [],
+    }
+
+    filenames = list(SILVER_SCHEMAS)
+    if max_workers is None:
+        max_workers = _default_workers(filenames, silver_dir)
+
+    # Check each expected file; map() keeps the report in schema order
+    if max_workers <= 1:
+        _init_worker()
+        file_results = list(map(_validate_file, filenames, repeat(silver_dir)))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker
+        ) as executor:
+            file_results = list(
+                executor.map(_validate_file, filenames, repeat(silver_dir))
+            )
+
+    for filename, details, recommendations in file_results:
+        results["total_files"] += 1
+        results["file_details"][filename] = details
+
+        if details["status"] == "valid":
+            results["valid_files"] += 1
+            # Track overall quality
+            if details["quality_issues"]:
+                results["quality_issues"] = True
+                results["quality_recommendations"].extend(recommendations)
+        else:
+            results["invalid_files"] += 1
+            results["validation_failed"] = True
 
     # Calculate overall quality score
     if results["valid_files"] > 0:
@@ -149,46 +328,74 @@ def validate_silver_files(silver_dir: Path) -> Dict[str, Any]:
     return results
 
 
+def _format_error(error: ErrorDetails, offset: int = 0) -> str:
+    """Format a pydantic error entry as 'Item <index>: <field>: <message>'.
+
+    offset is the position of the validated chunk within the whole file.
+    """
+    index, *field_path = error["loc"]
+    index = offset + int(index)
+    field = ".".join(str(part) for part in field_path)
+    if field:
+        return f"Item {index}: {field}: {error['msg']}"
+    return f"Item {index}: {error['msg']}"
+
+
 def print_validation_report(results: Dict[str, Any]) -> None:
-    """Print validation report."""
-    logger.info("\n" + "=" * 60)
-    logger.info("SILVER LAYER VALIDATION REPORT")
-    logger.info("=" * 60)
+    """Print validation report.
+
+    Lines are buffered and consecutive lines of the same level are emitted
+    as one multi-line log record instead of one record per line.
+    """
+    lines: List[Tuple[str, str]] = []
+    info = partial(_add_line, lines, "INFO")
+    warning = partial(_add_line, lines, "WARNING")
+    error = partial(_add_line, lines, "ERROR")
+
+    info("\n" + "=" * 60)
+    info("SILVER LAYER VALIDATION REPORT")
+    info("=" * 60)
 
     # Summary
-    logger.info(f"\nTotal Files: {results['total_files']}")
-    logger.info(f"Valid Files: {results['valid_files']}")
-    logger.info(f"Invalid Files: {results['invalid_files']}")
-    logger.info(f"Overall Quality Score: {results['overall_quality_score']:.2f}/10")
+    info(f"\nTotal Files: {results['total_files']}")
+    info(f"Valid Files: {results['valid_files']}")
+    info(f"Invalid Files: {results['invalid_files']}")
+    info(f"Overall Quality Score: {results['overall_quality_score']:.2f}/10")
 
     # File details
-    logger.info("\nFile Details:")
+    info("\nFile Details:")
     for filename, details in results["file_details"].items():
         status = details["status"]
         quality_score = details.get("quality_score", 0.0)
 
         if status == "valid":
-            logger.info(f"✅ {filename}: Valid (Quality: {quality_score:.2f}/10)")
+            info(f"✅ {filename}: Valid (Quality: {quality_score:.2f}/10)")
         elif status == "invalid":
-            logger.error(
-                f"❌ {filename}: Invalid ({len(details.get('errors', []))} errors)"
-            )
-            for error in details.get("errors", [])[:3]:  # Show first 3
-                logger.error(f"   - {error}")
+            error_count = details.get("error_count", len(details.get("errors", [])))
+            error(f"❌ {filename}: Invalid ({error_count} errors)")
+            for err in details.get("errors", [])[:3]:  # Show first 3
+                error(f"   - {err}")
         elif status == "missing":
-            logger.warning(f"⚠️  {filename}: Missing")
+            warning(f"⚠️  {filename}: Missing")
         elif status == "error":
-            logger.error(
-                f"❌ {filename}: Error - {details.get('errors', ['Unknown'])[0]}"
-            )
+            error(f"❌ {filename}: Error - {details.get('errors', ['Unknown'])[0]}")
 
     # Quality recommendations
     if results["quality_recommendations"]:
-        logger.info("\nQuality Recommendations:")
-        for rec in set(results["quality_recommendations"]):  # Unique recommendations
-            logger.info(f"  • {rec}")
+        info("\nQuality Recommendations:")
+        # Unique, lazily and in file order; set() gave arbitrary order
+        for rec in dict.fromkeys(results["quality_recommendations"]):
+            info(f"  • {rec}")
+
+    info("\n" + "=" * 60)
+
+    for level, group in groupby(lines, key=itemgetter(0)):
+        logger.log(level, "\n".join(text for _, text in group))
+
 
-    logger.info("\n" + "=" * 60)
+def _add_line(lines: List[Tuple[str, str]], level: str, text: str) -> None:
+    """Buffer one report line at the given log level."""
+    lines.append((level, text))
 
 
 def main():
@@ -201,7 +408,7 @@ def main():
         project_root = Path(__file__).parent.parent
         silver_dir = project_root / silver_dir
 
-    results = validate_silver_files(silver_dir)
+    results = validate_silver_files(silver_dir, max_workers=args.workers)
 
     if args.output:
         output_path = Path(args.output)
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def tmp_root(tmp_path_factory) -> Path:
+    """One temporary root shared by every test in a module."""
+    return tmp_path_factory.mktemp("layers")
+
+
+@pytest.fixture
+def layer_dirs(tmp_root, request) -> Tuple[Path, Path, Path]:
+    """Per-test (test_dir, bronze_dir, silver_dir) under the shared root."""
+    test_dir = tmp_root / request.node.name
+    bronze_dir = test_dir / "bronze"
+    silver_dir = test_dir / "silver"
+    bronze_dir.mkdir(parents=True)
+    silver_dir.mkdir()
+    return test_dir, bronze_dir, silver_dir
@@ -4,45 +4,15 @@ Run all tests in the test suite.
 """
 
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
 
-def run_tests():
-    """Run all tests."""
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern="test_*.py")
 
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-
-    # Print summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(
-        f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%"
-    )
-
-    if result.failures:
-        print("\nFAILURES:")
-        for test, traceback in result.failures:
-            print(f"  {test}: {traceback}")
-
-    if result.errors:
-        print("\nERRORS:")
-        for test, traceback in result.errors:
-            print(f"  {test}: {traceback}")
-
-    return result.wasSuccessful()
+def run_tests() -> int:
+    """Run all tests through pytest, which also collects function-style tests."""
+    return pytest.main([str(Path(__file__).parent), *sys.argv[1:]])
 
 
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(run_tests())
@@ -1,25 +1,17 @@
 #!/usr/bin/env python3
 """
-Test runner for Silver processing tests.
+Verbose test runner for the full suite, Silver processing tests included.
 """
 
 import sys
-import unittest
 from pathlib import Path
 
+import pytest
 
-def run_tests():
-    """Run all tests."""
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern="test_*.py")
-
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
 
-    # Return exit code based on test results
-    return 0 if result.wasSuccessful() else 1
+def run_tests() -> int:
+    """Run all tests."""
+    return pytest.main([str(Path(__file__).parent), "-v"])
 
 
 if __name__ == "__main__":
@@ -1,12 +1,9 @@
-#!/usr/bin/env python3
 """
 Unit tests for Silver layer processing functionality.
 """
 
-import json
-import tempfile
-import unittest
-from pathlib import Path
+import orjson
+import pytest
 
 from modules.cleaners.text_normalizer import (
     normalize_text,
@@ -15,46 +12,75 @@ from modules.cleaners.text_normalizer import (
     enhance_section_metadata,
 )
 from modules.parsers.lovdata_parser import Section
-
-
-class TestTextNormalization(unittest.TestCase):
-    """Test text normalization functions."""
-
-    def test_normalize_text_basic(self):
-        """Test basic text normalization."""
-        html_input = "<p>Hello <strong>world</strong>!</p>"
-        expected = "Hello world!"
-        result = normalize_text(html_input)
-        self.assertEqual(result, expected)
-
-    def test_normalize_text_with_scripts(self):
-        """Test normalization removes scripts and styles."""
-        html_input = """
+from modules.pipeline.processing_pipeline import process_lovdata_sources
+
+
+# The section, metadata and HTML fixtures are read-only, so build them once
+@pytest.fixture(scope="module")
+def section() -> Section:
+    """A parsed Lovdata section whose text still carries markup."""
+    return Section(
+        law_id="test_law",
+        section_id="§ 1-1",
+        path="Kapittel 1 § 1-1",
+        heading="Test heading",
+        text_plain="<p>Test content</p>",
+        source_url="https://example.com",
+        sha256="test_hash",
+    )
+
+
+@pytest.fixture(scope="module")
+def metadata() -> dict:
+    """Source metadata as read from sources.csv."""
+    return {
+        "source_id": "test_law",
+        "url": "https://example.com",
+        "domain": "tax",
+        "source_type": "law",
+        "publisher": "Lovdata",
+        "version": "current",
+        "jurisdiction": "NO",
+        "effective_from": "2020-01-01",
+        "effective_to": "",
+        "title": "Test Law",
+        "crawl_freq": "quarterly",
+    }
+
+
+@pytest.fixture(scope="module")
+def html_content() -> str:
+    """Raw section HTML passed alongside the section."""
+    return "<h1>Test Law</h1><p>Test content</p>"
+
+
+# Text normalization
+
+
+@pytest.mark.parametrize(
+    "html_input,expected",
+    [
+        pytest.param(
+            "<p>Hello <strong>world</strong>!</p>", "Hello world!", id="basic"
+        ),
+        pytest.param(
+            """
         <div>
             <script>alert('test');</script>
             <style>body { color: red; }</style>
             <p>Clean text here</p>
         </div>
-        """
-        expected = "Clean text here"
-        result = normalize_text(html_input)
-        self.assertEqual(result, expected)
-
-    def test_normalize_text_whitespace(self):
-        """Test whitespace normalization."""
-        html_input = "  Multiple   spaces\n\nand\t\ttabs  "
-        expected = "Multiple spaces and tabs"
-        result = normalize_text(html_input)
-        self.assertEqual(result, expected)
-
-    def test_normalize_text_empty(self):
-        """Test empty input handling."""
-        self.assertEqual(normalize_text(""), "")
-        self.assertEqual(normalize_text(None), "")
-
-    def test_normalize_text_complex_html(self):
-        """Test complex HTML structure."""
-        html_input = """
+        """,
+            "Clean text here",
+            id="scripts",
+        ),
+        pytest.param(
+            "  Multiple   spaces\n\nand\t\ttabs  ",
+            "Multiple spaces and tabs",
+            id="whitespace",
+        ),
+        pytest.param(
+            """
         <div class="content">
             <h1>Title</h1>
             <p>Paragraph with <a href="#">link</a> and <em>emphasis</em>.</p>
@@ -63,342 +89,323 @@ class TestTextNormalization(unittest.TestCase):
                 <li>Item 2</li>
             </ul>
         </div>
-        """
-        expected = "Title Paragraph with link and emphasis. Item 1 Item 2"
-        result = normalize_text(html_input)
-        self.assertEqual(result, expected)
-
-
-class TestStableHash(unittest.TestCase):
-    """Test stable hash computation."""
-
-    def test_compute_stable_hash_basic(self):
-        """Test basic hash computation."""
-        text = "Hello world"
-        hash1 = compute_stable_hash(text)
-        hash2 = compute_stable_hash(text)
-        self.assertEqual(hash1, hash2)
-        self.assertEqual(len(hash1), 64)  # SHA256 hex length
-
-    def test_compute_stable_hash_canonicalization(self):
-        """Test hash is stable across whitespace variations."""
-        text1 = "  Hello   world  "
-        text2 = "hello world"
-        text3 = "HELLO WORLD"
-
-        hash1 = compute_stable_hash(text1)
-        hash2 = compute_stable_hash(text2)
-        hash3 = compute_stable_hash(text3)
-
-        self.assertEqual(hash1, hash2)
-        self.assertEqual(hash2, hash3)
-
-    def test_compute_stable_hash_empty(self):
-        """Test empty input handling."""
-        self.assertEqual(compute_stable_hash(""), "")
-        self.assertEqual(compute_stable_hash(None), "")
-
-
-class TestLegalMetadataExtraction(unittest.TestCase):
-    """Test legal metadata extraction."""
-
-    def test_extract_law_title(self):
-        """Test law title extraction."""
-        html = "<h1 class='title'>Merverdiavgiftsloven</h1>"
-        metadata = {"title": "Test Law"}
-        result = extract_legal_metadata(html, metadata)
-        self.assertEqual(result["law_title"], "Merverdiavgiftsloven")
-
-    def test_extract_chapter(self):
-        """Test chapter extraction."""
-        html = "<h2>Kapittel 5. Avgiftsberegning</h2>"
-        metadata = {}
-        result = extract_legal_metadata(html, metadata)
-        self.assertEqual(result["chapter"], "Kapittel 5. Avgiftsberegning")
-
-    def test_detect_repealed(self):
-        """Test repealed status detection."""
-        html = "<p>Denne paragrafen er opphevet ved lov 2020 nr. 1</p>"
-        metadata = {}
-        result = extract_legal_metadata(html, metadata)
-        self.assertTrue(result["repealed"])
-
-    def test_extract_amendment_dates(self):
-        """Test amendment date extraction."""
-        html = """
-        <p>Endret ved lov 15 juni 2020 nr. 45 (ikr. 1 juli 2020)</p>
-        <p>Endret ved lov 20 desember 2021 nr. 100</p>
-        """
-        metadata = {}
-        result = extract_legal_metadata(html, metadata)
-        self.assertIn("15 juni 2020", result["amended_dates"])
-        self.assertIn("20 desember 2021", result["amended_dates"])
-
-    def test_no_metadata_found(self):
-        """Test when no metadata is found."""
-        html = "<p>Just some text</p>"
-        metadata = {}
-        result = extract_legal_metadata(html, metadata)
-        self.assertEqual(result.get("law_title", ""), "")
-        self.assertEqual(result.get("chapter", ""), "")
-        self.assertFalse(result.get("repealed", False))
-        self.assertEqual(result.get("amended_dates", []), [])
-
-
-class TestSectionMetadataEnhancement(unittest.TestCase):
-    """Test section metadata enhancement."""
-
-    def setUp(self):
-        """Set up test data."""
-        self.section = Section(
-            law_id="test_law",
-            section_id="§ 1-1",
-            path="Kapittel 1 § 1-1",
-            heading="Test heading",
-            text_plain="<p>Test content</p>",
-            source_url="https://example.com",
-            sha256="test_hash",
-        )
-        self.metadata = {
+        """,
+            "Title Paragraph with link and emphasis. Item 1 Item 2",
+            id="complex_html",
+        ),
+        pytest.param("<!-- only a comment -->", "", id="comment_only"),
+        # A stray '<' in plain text is kept, not read as a tag
+        pytest.param("x<y z", "x<y z", id="stray_lt"),
+        pytest.param(
+            '<?xml version="1.0" encoding="utf-8"?><p>Hei</p>',
+            "Hei",
+            id="xml_declaration",
+            marks=pytest.mark.filterwarnings("ignore::bs4.XMLParsedAsHTMLWarning"),
+        ),
+        pytest.param("", "", id="empty"),
+        pytest.param(None, "", id="none"),
+    ],
+)
+def test_normalize_text(html_input, expected):
+    """Test normalization strips markup, scripts and extra whitespace."""
+    assert normalize_text(html_input) == expected
+
+
+# Stable hash
+
+
+def test_compute_stable_hash_basic():
+    """Test basic hash computation."""
+    text = "Hello world"
+    hash1 = compute_stable_hash(text)
+    hash2 = compute_stable_hash(text)
+    assert hash1 == hash2
+    assert len(hash1) == 64  # SHA256 hex length
+
+
+def test_compute_stable_hash_canonicalization():
+    """Test hash is stable across whitespace variations."""
+    hash1 = compute_stable_hash("  Hello   world  ")
+    hash2 = compute_stable_hash("hello world")
+    hash3 = compute_stable_hash("HELLO WORLD")
+
+    assert hash1 == hash2
+    assert hash2 == hash3
+
+
+def test_compute_stable_hash_empty():
+    """Test empty input handling."""
+    assert compute_stable_hash("") == ""
+    assert compute_stable_hash(None) == ""
+
+
+# Legal metadata extraction
+
+
+def test_extract_law_title():
+    """Test law title extraction."""
+    html = "<h1 class='title'>Merverdiavgiftsloven</h1>"
+    result = extract_legal_metadata(html, {"title": "Test Law"})
+    assert result["law_title"] == "Merverdiavgiftsloven"
+
+
+def test_extract_chapter():
+    """Test chapter extraction."""
+    html = "<h2>Kapittel 5. Avgiftsberegning</h2>"
+    result = extract_legal_metadata(html, {})
+    assert result["chapter"] == "Kapittel 5. Avgiftsberegning"
+
+
+def test_detect_repealed():
+    """Test repealed status detection."""
+    html = "<p>Denne paragrafen er opphevet ved lov 2020 nr. 1</p>"
+    result = extract_legal_metadata(html, {})
+    assert result["repealed"]
+
+
+def test_extract_amendment_dates():
+    """Test amendment date extraction."""
+    html = """
+    <p>Endret ved lov 15 juni 2020 nr. 45 (ikr. 1 juli 2020)</p>
+    <p>Endret ved lov 20 desember 2021 nr. 100</p>
+    """
+    result = extract_legal_metadata(html, {})
+    assert "15 juni 2020" in result["amended_dates"]
+    assert "20 desember 2021" in result["amended_dates"]
+
+
+def test_no_metadata_found():
+    """Test when no metadata is found."""
+    result = extract_legal_metadata("<p>Just some text</p>", {})
+    assert result.get("law_title", "") == ""
+    assert result.get("chapter", "") == ""
+    assert not result.get("repealed", False)
+    assert result.get("amended_dates", []) == []
+
+
+# Section metadata enhancement
+
+
+def test_enhance_section_metadata_basic(section, metadata, html_content):
+    """Test basic metadata enhancement."""
+    result = enhance_section_metadata(section, metadata, html_content)
+
+    # Check original fields
+    assert result["law_id"] == "test_law"
+    assert result["section_id"] == "§ 1-1"
+    assert result["path"] == "Kapittel 1 § 1-1"
+    assert result["heading"] == "Test heading"
+
+    # Check normalized text
+    assert result["text_plain"] == "Test content"
+    assert result["text_html"] == html_content
+
+    # Check metadata fields
+    assert result["domain"] == "tax"
+    assert result["source_type"] == "law"
+    assert result["publisher"] == "Lovdata"
+    assert result["version"] == "current"
+    assert result["jurisdiction"] == "NO"
+    assert result["effective_from"] == "2020-01-01"
+    assert result["effective_to"] == ""
+    assert result["crawl_freq"] == "quarterly"
+
+    # Check computed fields
+    assert isinstance(result["sha256"], str)
+    assert len(result["sha256"]) == 64
+    assert isinstance(result["token_count"], int)
+    assert result["token_count"] > 0
+    assert isinstance(result["ingested_at"], str)
+    assert isinstance(result["processed_at"], str)
+
+
+def test_enhance_section_metadata_missing_url(metadata, html_content):
+    """Test handling of missing source URL."""
+    section_no_url = Section(
+        law_id="test_law",
+        section_id="§ 1-1",
+        path="Kapittel 1 § 1-1",
+        heading="Test heading",
+        text_plain="Test content",
+        source_url="",
+        sha256="test_hash",
+    )
+
+    result = enhance_section_metadata(section_no_url, metadata, html_content)
+    # Falls back to metadata URL
+    assert result["source_url"] == "https://example.com"
+
+
+def test_enhance_section_metadata_legal_extraction(section, metadata):
+    """Test legal metadata extraction in enhancement."""
+    html_with_legal = """
+    <h1>Merverdiavgiftsloven</h1>
+    <h2>Kapittel 5. Avgiftsberegning</h2>
+    <p>Denne paragrafen er opphevet ved lov 15 juni 2020 nr. 1</p>
+    """
+
+    result = enhance_section_metadata(section, metadata, html_with_legal)
+
+    assert result["law_title"] == "Merverdiavgiftsloven"
+    assert result["chapter"] == "Kapittel 5. Avgiftsberegning"
+    assert result["repealed"]
+    # The amendment date extraction might not work with this simple pattern
+    # Just check that we have some amended_dates structure
+    assert isinstance(result["amended_dates"], list)
+
+
+# Silver processing integration
+
+
+@pytest.mark.integration
+def test_quality_checks(layer_dirs):
+    """Test quality checks in processing."""
+    _, bronze_dir, silver_dir = layer_dirs
+
+    # Create test metadata
+    metadata = [
+        {
             "source_id": "test_law",
             "url": "https://example.com",
+            "sha256": "test_hash",
             "domain": "tax",
             "source_type": "law",
             "publisher": "Lovdata",
+            "title": "Test Law",
             "version": "current",
             "jurisdiction": "NO",
             "effective_from": "2020-01-01",
             "effective_to": "",
-            "title": "Test Law",
             "crawl_freq": "quarterly",
         }
-        self.html_content = "<h1>Test Law</h1><p>Test content</p>"
-
-    def test_enhance_section_metadata_basic(self):
-        """Test basic metadata enhancement."""
-        result = enhance_section_metadata(
-            self.section, self.metadata, self.html_content
-        )
-
-        # Check original fields
-        self.assertEqual(result["law_id"], "test_law")
-        self.assertEqual(result["section_id"], "§ 1-1")
-        self.assertEqual(result["path"], "Kapittel 1 § 1-1")
-        self.assertEqual(result["heading"], "Test heading")
-
-        # Check normalized text
-        self.assertEqual(result["text_plain"], "Test content")
-        self.assertEqual(result["text_html"], self.html_content)
-
-        # Check metadata fields
-        self.assertEqual(result["domain"], "tax")
-        self.assertEqual(result["source_type"], "law")
-        self.assertEqual(result["publisher"], "Lovdata")
-        self.assertEqual(result["version"], "current")
-        self.assertEqual(result["jurisdiction"], "NO")
-        self.assertEqual(result["effective_from"], "2020-01-01")
-        self.assertEqual(result["effective_to"], "")
-        self.assertEqual(result["crawl_freq"], "quarterly")
-
-        # Check computed fields
-        self.assertIsInstance(result["sha256"], str)
-        self.assertEqual(len(result["sha256"]), 64)
-        self.assertIsInstance(result["token_count"], int)
-        self.assertGreater(result["token_count"], 0)
-        self.assertIsInstance(result["ingested_at"], str)
-        self.assertIsInstance(result["processed_at"], str)
-
-    def test_enhance_section_metadata_missing_url(self):
-        """Test handling of missing source URL."""
-        section_no_url = Section(
-            law_id="test_law",
-            section_id="§ 1-1",
-            path="Kapittel 1 § 1-1",
-            heading="Test heading",
-            text_plain="Test content",
-            source_url="",
-            sha256="test_hash",
-        )
-
-        result = enhance_section_metadata(
-            section_no_url, self.metadata, self.html_content
-        )
-        self.assertEqual(
-            result["source_url"], "https://example.com"
-        )  # Falls back to metadata URL
-
-    def test_enhance_section_metadata_legal_extraction(self):
-        """Test legal metadata extraction in enhancement."""
-        html_with_legal = """
-        <h1>Merverdiavgiftsloven</h1>
-        <h2>Kapittel 5. Avgiftsberegning</h2>
-        <p>Denne paragrafen er opphevet ved lov 15 juni 2020 nr. 1</p>
-        """
-
-        result = enhance_section_metadata(self.section, self.metadata, html_with_legal)
-
-        self.assertEqual(result["law_title"], "Merverdiavgiftsloven")
-        self.assertEqual(result["chapter"], "Kapittel 5. Avgiftsberegning")
-        self.assertTrue(result["repealed"])
-        # The amendment date extraction might not work with this simple pattern
-        # Just check that we have some amended_dates structure
-        self.assertIsInstance(result["amended_dates"], list)
-
-
-class TestSilverProcessingIntegration(unittest.TestCase):
-    """Integration tests for Silver processing."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.bronze_dir = Path(self.temp_dir) / "bronze"
-        self.silver_dir = Path(self.temp_dir) / "silver"
-        self.bronze_dir.mkdir()
-        self.silver_dir.mkdir()
-
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
-    def test_quality_checks(self):
-        """Test quality checks in processing."""
-        # Create test metadata
-        metadata = [
-            {
-                "source_id": "test_law",
-                "url": "https://example.com",
-                "sha256": "test_hash",
-                "domain": "tax",
-                "source_type": "law",
-                "publisher": "Lovdata",
-                "title": "Test Law",
-                "version": "current",
-                "jurisdiction": "NO",
-                "effective_from": "2020-01-01",
-                "effective_to": "",
-                "crawl_freq": "quarterly",
-            }
-        ]
-
-        metadata_file = self.bronze_dir / "ingestion_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
-
-        # Create sources_lookup for the test
-        sources_lookup = {
-            "test_law": {
-                "source_id": "test_law",
-                "url": "https://example.com",
-                "domain": "tax",
-                "source_type": "law",
-                "publisher": "Lovdata",
-                "title": "Test Law",
-                "version": "current",
-                "jurisdiction": "NO",
-                "effective_from": "2020-01-01",
-                "effective_to": "",
-                "crawl_freq": "quarterly",
-            }
-        }
+    ]
 
-        # Create test HTML file with proper Lovdata structure
-        html_content = """
-        <html>
-        <body>
-            <h1>Test Law</h1>
-            <div class="morTag_p paragraf" id="PARAGRAF_1-1">
-                <h3 class="paragrafHeader">
-                    <span class="paragrafValue">§ 1-1.</span>
-                    <span class="paragrafTittel">Test heading</span>
-                </h3>
-                <div class="morTag_an avsnitt">
-                    <span class="avsnittNummer">(1)</span>
-                    <span>This is a test paragraph with sufficient content to pass quality checks and meet the minimum length requirements for processing.</span>
-                </div>
+    metadata_file = bronze_dir / "ingestion_metadata.json"
+    metadata_file.write_bytes(orjson.dumps(metadata))
+
+    # Create sources_lookup for the test
+    sources_lookup = {
+        "test_law": {
+            "source_id": "test_law",
+            "url": "https://example.com",
+            "domain": "tax",
+            "source_type": "law",
+            "publisher": "Lovdata",
+            "title": "Test Law",
+            "version": "current",
+            "jurisdiction": "NO",
+            "effective_from": "2020-01-01",
+            "effective_to": "",
+            "crawl_freq": "quarterly",
+        }
+    }
+
+    # Create test HTML file with proper Lovdata structure
+    html_content = """
+    <html>
+    <body>
+        <h1>Test Law</h1>
+        <div class="morTag_p paragraf" id="PARAGRAF_1-1">
+            <h3 class="paragrafHeader">
+                <span class="paragrafValue">§ 1-1.</span>
+                <span class="paragrafTittel">Test heading</span>
+            </h3>
+            <div class="morTag_an avsnitt">
+                <span class="avsnittNummer">(1)</span>
+                <span>This is a test paragraph with sufficient content to pass quality checks and meet the minimum length requirements for processing.</span>
             </div>
-        </body>
-        </html>
-        """
-
-        html_file = self.bronze_dir / "test_law.html"
-        with open(html_file, "w") as f:
-            f.write(html_content)
-
-        # Test processing using the new pipeline
-        from modules.pipeline.processing_pipeline import process_lovdata_sources
-
-        # Create sources list from sources_lookup
-        sources = [source for source in sources_lookup.values()]
-
-        process_lovdata_sources(sources, self.bronze_dir, self.silver_dir)
-        sections = []
-
-        # Load the generated sections from silver layer
-        law_sections_file = self.silver_dir / "law_sections.json"
-        if law_sections_file.exists():
-            with open(law_sections_file, "r") as f:
-                sections = json.load(f)
-
-        self.assertGreater(len(sections), 0)
-
-        # Check quality
-        for section in sections:
-            self.assertGreaterEqual(len(section["text_plain"]), 50)
-            self.assertTrue(section["source_url"])
-
-    def test_unknown_law_skipping(self):
-        """Test that files without metadata in sources_lookup are skipped."""
-        # Create HTML file without corresponding metadata in sources_lookup
-        html_content = """
-        <html>
-        <body>
-            <h1>Unknown Law</h1>
-            <div class="morTag_p paragraf" id="PARAGRAF_1-1">
-                <h3 class="paragrafHeader">
-                    <span class="paragrafValue">§ 1-1.</span>
-                    <span class="paragrafTittel">Test heading</span>
-                </h3>
-                <div class="morTag_an avsnitt">
-                    <span class="avsnittNummer">(1)</span>
-                    <span>This law has no metadata entry and should be skipped.</span>
-                </div>
+        </div>
+    </body>
+    </html>
+    """
+
+    html_file = bronze_dir / "test_law.html"
+    with open(html_file, "w") as f:
+        f.write(html_content)
+
+    # Test processing using the new pipeline
+    # Create sources list from sources_lookup
+    sources = [source for source in sources_lookup.values()]
+
+    process_lovdata_sources(sources, bronze_dir, silver_dir)
+    sections = []
+
+    # Load the generated sections from silver layer
+    law_sections_file = silver_dir / "law_sections.json"
+    if law_sections_file.exists():
+        sections = orjson.loads(law_sections_file.read_bytes())
+
+    assert len(sections) > 0
+
+    # Check quality
+    for section in sections:
+        assert len(section["text_plain"]) >= 50
+        assert section["source_url"]
+
+
+@pytest.mark.integration
+def test_unknown_law_skipping(layer_dirs):
+    """Test that files without metadata in sources_lookup are skipped."""
+    _, bronze_dir, silver_dir = layer_dirs
+
+    # Create HTML file without corresponding metadata in sources_lookup
+    html_content = """
+    <html>
+    <body>
+        <h1>Unknown Law</h1>
+        <div class="morTag_p paragraf" id="PARAGRAF_1-1">
+            <h3 class="paragrafHeader">
+                <span class="paragrafValue">§ 1-1.</span>
+                <span class="paragrafTittel">Test heading</span>
+            </h3>
+            <div class="morTag_an avsnitt">
+                <span class="avsnittNummer">(1)</span>
+                <span>This law has no metadata entry and should be skipped.</span>
             </div>
-        </body>
-        </html>
-        """
+        </div>
+    </body>
+    </html>
+    """
+
+    html_file = bronze_dir / "unknown_law.html"
+    with open(html_file, "w") as f:
+        f.write(html_content)
+
+    # Create empty metadata file
+    metadata_file = bronze_dir / "ingestion_metadata.json"
+    metadata_file.write_bytes(orjson.dumps([]))
 
-        html_file = self.bronze_dir / "unknown_law.html"
-        with open(html_file, "w") as f:
-            f.write(html_content)
+    # Create empty sources_lookup (no entries for unknown_law)
+    sources_lookup = {}
 
-        # Create empty metadata file
-        metadata_file = self.bronze_dir / "ingestion_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump([], f)
+    # Test processing using the new pipeline
+    # Create sources list from sources_lookup (empty in this case)
+    sources = [source for source in sources_lookup.values()]
 
-        # Create empty sources_lookup (no entries for unknown_law)
-        sources_lookup = {}
+    process_lovdata_sources(sources, bronze_dir, silver_dir)
+    sections = []
 
-        # Test processing using the new pipeline
-        from modules.pipeline.processing_pipeline import process_lovdata_sources
+    # Load the generated sections from silver layer (should be empty)
+    law_sections_file = silver_dir / "law_sections.json"
+    if law_sections_file.exists():
+        sections = orjson.loads(law_sections_file.read_bytes())
 
-        # Create sources list from sources_lookup (empty in this case)
-        sources = [source for source in sources_lookup.values()]
+    # Should skip unknown files and return empty list
+    assert len(sections) == 0
 
-        process_lovdata_sources(sources, self.bronze_dir, self.silver_dir)
-        sections = []
 
-        # Load the generated sections from silver layer (should be empty)
-        law_sections_file = self.silver_dir / "law_sections.json"
-        if law_sections_file.exists():
-            with open(law_sections_file, "r") as f:
-                sections = json.load(f)
+@pytest.mark.integration
+def test_pre_parsed_sections_skip_bronze(layer_dirs, section, metadata):
+    """Test that pre-parsed sections are processed without a Bronze file."""
+    _, bronze_dir, silver_dir = layer_dirs
 
-        # Should skip unknown files and return empty list
-        self.assertEqual(len(sections), 0)
+    stats = process_lovdata_sources(
+        [metadata], bronze_dir, silver_dir, pre_parsed={"test_law": [section]}
+    )
 
+    assert stats["errors"] == []
+    assert stats["total_sections"] == 1
 
-if __name__ == "__main__":
-    unittest.main()
+    sections = orjson.loads((silver_dir / "law_sections.json").read_bytes())
+    assert sections[0]["section_id"] == "§ 1-1"
+    assert sections[0]["text_plain"] == "Test content"
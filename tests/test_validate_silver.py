@@ -0,0 +1,160 @@
+"""
+Unit tests for the Silver layer validation script.
+"""
+
+import json
+from pathlib import Path
+
+from scripts import validate_silver
+
+VALID_RATE = {
+    "rate_id": "vat_standard_25",
+    "rate_label": "Standard VAT 25%",
+    "rate_value": 25.0,
+    "description": "Standard VAT rate",
+    "effective_from": "2024-01-01",
+    "source_url": "https://www.skatteetaten.no/satser/merverdiavgift/",
+    "sha256": "a" * 64,
+    "domain": "tax",
+    "source_type": "rates",
+    "publisher": "Skatteetaten",
+}
+
+
+def _write_json(path: Path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_missing_files_fail_validation(tmp_path):
+    """All expected files missing should fail validation."""
+    results = validate_silver.validate_silver_files(tmp_path)
+
+    assert results["validation_failed"] is True
+    assert results["total_files"] == 4
+    assert results["invalid_files"] == 4
+    assert results["file_details"]["rate_table.json"]["status"] == "missing"
+
+
+def test_valid_file_gets_quality_score(tmp_path):
+    """A schema-valid file is marked valid and scored."""
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE, VALID_RATE])
+
+    results = validate_silver.validate_silver_files(tmp_path)
+    details = results["file_details"]["rate_table.json"]
+
+    assert details["status"] == "valid"
+    assert details["errors"] == []
+    assert details["quality_score"] > 0
+    assert results["valid_files"] == 1
+
+
+def test_invalid_records_report_index_and_field(tmp_path):
+    """Validation errors reference the offending record index and field."""
+    broken = {k: v for k, v in VALID_RATE.items() if k != "rate_label"}
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE, broken, "not a record"])
+
+    results = validate_silver.validate_silver_files(tmp_path)
+    details = results["file_details"]["rate_table.json"]
+
+    assert details["status"] == "invalid"
+    assert details["errors"][0] == "Item 1: rate_label: Field required"
+    assert details["errors"][1].startswith("Item 2: ")
+
+
+def test_non_list_file_is_invalid(tmp_path):
+    """A JSON object instead of a list is rejected."""
+    _write_json(tmp_path / "rate_table.json", VALID_RATE)
+
+    results = validate_silver.validate_silver_files(tmp_path)
+
+    assert results["file_details"]["rate_table.json"]["status"] == "invalid"
+    assert results["file_details"]["rate_table.json"]["errors"] == [
+        "Invalid JSON format"
+    ]
+
+
+def test_inline_and_pool_results_match(tmp_path):
+    """Running inline gives the same report as the process pool."""
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE])
+    _write_json(tmp_path / "law_sections.json", {"not": "a list"})
+
+    pooled = validate_silver.validate_silver_files(tmp_path, max_workers=2)
+    inline = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+
+    assert list(pooled["file_details"]) == list(inline["file_details"])
+    for name, details in pooled["file_details"].items():
+        assert details["status"] == inline["file_details"][name]["status"]
+        assert details["errors"] == inline["file_details"][name]["errors"]
+    assert pooled["valid_files"] == inline["valid_files"] == 1
+
+
+def test_small_inputs_validate_inline(tmp_path, monkeypatch):
+    """Without max_workers, small inputs never start a process pool."""
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for small inputs")
+
+    monkeypatch.setattr(validate_silver, "ProcessPoolExecutor", no_pool)
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE])
+
+    results = validate_silver.validate_silver_files(tmp_path)
+
+    assert results["valid_files"] == 1
+
+
+def test_streamed_file_matches_in_memory(tmp_path, monkeypatch):
+    """Files above the size threshold are streamed in chunks with the same result."""
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE] * 5)
+    in_memory = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+
+    monkeypatch.setattr(validate_silver, "STREAM_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(validate_silver, "STREAM_CHUNK_SIZE", 2)
+    streamed = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+
+    assert (
+        streamed["file_details"]["rate_table.json"]["quality_score"]
+        == in_memory["file_details"]["rate_table.json"]["quality_score"]
+    )
+    assert streamed["valid_files"] == 1
+
+
+def test_streamed_errors_use_file_index(tmp_path, monkeypatch):
+    """Error indices from later chunks refer to the position in the file."""
+    broken = {k: v for k, v in VALID_RATE.items() if k != "rate_label"}
+    _write_json(tmp_path / "rate_table.json", [VALID_RATE] * 3 + [broken])
+    _write_json(tmp_path / "law_sections.json", {"not": "a list"})
+
+    monkeypatch.setattr(validate_silver, "STREAM_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(validate_silver, "STREAM_CHUNK_SIZE", 2)
+    results = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+
+    assert results["file_details"]["rate_table.json"]["errors"] == [
+        "Item 3: rate_label: Field required"
+    ]
+    assert results["file_details"]["law_sections.json"]["errors"] == [
+        "Invalid JSON format"
+    ]
+
+
+def test_quality_recommendations_in_saved_report(tmp_path):
+    """Recommendations for files with issues stay in the top-level report."""
+    bad_url = {**VALID_RATE, "source_url": "not-a-url"}
+    _write_json(tmp_path / "rate_table.json", [bad_url, bad_url])
+
+    results = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+
+    assert "Fix invalid URLs" in results["quality_recommendations"]
+    assert "quality_recommendations" not in results["file_details"]["rate_table.json"]
+
+
+def test_only_first_errors_are_formatted(tmp_path):
+    """Every error is counted but only the first few are reported."""
+    broken = {k: v for k, v in VALID_RATE.items() if k != "rate_label"}
+    _write_json(tmp_path / "rate_table.json", [broken] * 20)
+
+    results = validate_silver.validate_silver_files(tmp_path, max_workers=1)
+    details = results["file_details"]["rate_table.json"]
+
+    assert details["error_count"] == 20
+    assert len(details["errors"]) == validate_silver.MAX_REPORTED_ERRORS
+    assert details["errors"][-1] == "Item 4: rate_label: Field required"